@@ -5,6 +5,23 @@ import re
 from typing import Dict, List, Any
 
 
+# Every keyword-led line form, fused into one alternation.  Each branch is
+# wrapped in a group named after its token type so ``m.lastgroup`` tells the
+# tokeniser which form matched; branch order mirrors the old sequential checks.
+_TOKEN_RE = re.compile(
+    r'(?P<CLASS_DEF>class\s+(?P<cls>\w+)\s*\{)'
+    r'|(?P<FN_DEF>fn\s+(?P<fn>\w+)\s*\((?P<fnp>[^)]*)\)\s*\{)'
+    r'|(?P<FIELD_DEF>field\s+(?P<fld>\w+)\s*=\s*(?P<fldx>.*))'
+    r'|(?P<LET_DEF>let\s+(?P<let>\w+)\s*=\s*(?P<letx>.*))'
+    r'|(?P<RETURN>return\s+(?P<ret>.*))'
+    r'|(?P<IF_STMT>if\s+(?P<ifc>.+?)\s*\{)'
+    r'|(?P<ELSE_STMT>\}\s*else\s*\{|else\s*\{)'
+)
+# Leading text a line must have for _TOKEN_RE to be worth trying
+_KEYWORD_PREFIXES = ('class', 'fn', 'field', 'let', 'return', 'if', 'else', '}')
+_ASSIGN_RE = re.compile(r'^([\w\.]+)\s*=\s*(.*)')
+
+
 class KSPLCompileError(Exception):
     """Raised for syntax/structural errors during KSPL compilation."""
 
@@ -43,59 +60,40 @@ class KSPLCompiler:
 
     def tokenize(self, source: str) -> List[Dict]:
         tokens: List[Dict] = []
-        lines = source.split('\n')
-        line_num = 0
-
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-            if not line or line.startswith('//'):
-                continue
-
-            # Class definition
-            m = re.match(r'^class\s+(\w+)\s*\{', line)
-            if m:
-                tokens.append({'type': 'CLASS_DEF', 'value': m.group(1), 'line': line_num})
-                continue
-
-            # Function definition
-            m = re.match(r'^fn\s+(\w+)\s*\(([^)]*)\)\s*\{', line)
-            if m:
-                params = [p.strip() for p in m.group(2).split(',') if p.strip()]
-                tokens.append({'type': 'FN_DEF', 'value': m.group(1),
-                               'params': params, 'line': line_num})
-                continue
-
-            # Field definition
-            m = re.match(r'^field\s+(\w+)\s*=\s*(.*)', line)
-            if m:
-                tokens.append({'type': 'FIELD_DEF', 'value': m.group(1),
-                               'expr': m.group(2), 'line': line_num})
-                continue
-
-            # Variable declaration
-            m = re.match(r'^let\s+(\w+)\s*=\s*(.*)', line)
-            if m:
-                tokens.append({'type': 'LET_DEF', 'value': m.group(1),
-                               'expr': m.group(2), 'line': line_num})
-                continue
-
-            # Return statement
-            m = re.match(r'^return\s+(.*)', line)
-            if m:
-                tokens.append({'type': 'RETURN', 'expr': m.group(1), 'line': line_num})
-                continue
-
-            # If statement
-            m = re.match(r'^if\s+(.+?)\s*\{', line)
-            if m:
-                tokens.append({'type': 'IF_STMT', 'condition': m.group(1), 'line': line_num})
-                continue
-
-            # Else statement
-            if re.match(r'^\}\s*else\s*\{|^else\s*\{', line):
-                tokens.append({'type': 'ELSE_STMT', 'line': line_num})
-                continue
+        # Drop blank and comment lines up front, keeping 1-based line numbers
+        stripped = [ln.strip() for ln in source.split('\n')]
+        meaningful = [(n, ln) for n, ln in enumerate(stripped, 1)
+                      if ln and not ln.startswith('//')]
+
+        for line_num, line in meaningful:
+            # Keyword-led forms: class / fn / field / let / return / if / else
+            if line.startswith(_KEYWORD_PREFIXES):
+                m = _TOKEN_RE.match(line)
+                if m:
+                    kind = m.lastgroup
+                    if kind == 'CLASS_DEF':
+                        tokens.append({'type': kind, 'value': m.group('cls'),
+                                       'line': line_num})
+                    elif kind == 'FN_DEF':
+                        params = [p.strip() for p in m.group('fnp').split(',')
+                                  if p.strip()]
+                        tokens.append({'type': kind, 'value': m.group('fn'),
+                                       'params': params, 'line': line_num})
+                    elif kind == 'FIELD_DEF':
+                        tokens.append({'type': kind, 'value': m.group('fld'),
+                                       'expr': m.group('fldx'), 'line': line_num})
+                    elif kind == 'LET_DEF':
+                        tokens.append({'type': kind, 'value': m.group('let'),
+                                       'expr': m.group('letx'), 'line': line_num})
+                    elif kind == 'RETURN':
+                        tokens.append({'type': kind, 'expr': m.group('ret'),
+                                       'line': line_num})
+                    elif kind == 'IF_STMT':
+                        tokens.append({'type': kind, 'condition': m.group('ifc'),
+                                       'line': line_num})
+                    else:
+                        tokens.append({'type': kind, 'line': line_num})
+                    continue
 
             # Closing brace
             if line == '}':
@@ -103,7 +101,7 @@ class KSPLCompiler:
                 continue
 
             # Assignment (not equality check)
-            m = re.match(r'^([\w\.]+)\s*=\s*(.*)', line)
+            m = _ASSIGN_RE.match(line)
             if m and '==' not in line:
                 tokens.append({'type': 'ASSIGNMENT', 'target': m.group(1),
                                'expr': m.group(2), 'line': line_num})
@@ -15,14 +15,215 @@ Supports:
 
 import re
 import ast as _ast
+from ast import parse as _ast_parse
+import copy
+import operator
 import sys
-from typing import Dict, List, Any, Optional
+import types
+from typing import Any, Callable, Dict, List, Optional
 
 from .runtime import (
     VirtuCard, VirtualTerminal, Avatar, VirtualItem,
     create_virtucard, transfer,
 )
 
+try:  # optional: native compilation of numeric methods
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+# ---------------------------------------------------------------------------
+
+# Block headers recognised by parse()
+_CLASS_HEAD_RE = re.compile(r'^class\s+\w+\s*\{')
+_FN_HEAD_RE = re.compile(r'^fn\s+\w+\s*\(')
+_IF_HEAD_RE = re.compile(r'^if\s*[\(\s]')
+_FOR_HEAD_RE = re.compile(r'^for\s+\w+\s+in\s+')
+_WHILE_HEAD_RE = re.compile(r'^while\s*[\(\s]')
+_ELSEIF_HEAD_RE = re.compile(r'^else\s+if\s*[\(\s]')
+_ELSE_HEAD_RE = re.compile(r'^else\s*\{')
+
+# Block header details
+_CLASS_RE = re.compile(r'^class\s+(\w+)')
+_FN_RE = re.compile(r'^fn\s+(\w+)\s*\(([^)]*)\)')
+_FOR_RE = re.compile(r'^for\s+(\w+)\s+in\s+(.*?)\s*\{')
+_FIELD_RE = re.compile(r'^field\s+(\w+)\s*=\s*(.*)')
+_CLOSE_BRACE_PREFIX_RE = re.compile(r'^\}\s*')
+_ELSEIF_PREFIX_RE = re.compile(r'^else\s+if\s*')
+_INLINE_SPLIT_RE = re.compile(r'\s{2,}|\n')
+
+# Statements
+_LET_RE = re.compile(r'^let\s+(\w+)\s*=\s*(.+)$', re.DOTALL)
+_ASSIGN_RE = re.compile(r'^([\w\.]+(?:\[.*?\])?)\s*=\s*(.+)$', re.DOTALL)
+
+# Expressions
+_NAME_RE = re.compile(r'\w+')
+_CALL_HEAD_RE = re.compile(r'^[\w\.]+\s*\(')
+_HAS_OP_RE = re.compile(r'\s*(==|!=|<=|>=|<|>|\+|-|\*|/|%|\band\b|\bor\b|\bnot\b)\s*')
+_DOTTED_RE = re.compile(r'\w+(?:\.\w+)+')
+_INDEX_RE = re.compile(r'\[(.+)\]')
+_METHOD_CALL_RE = re.compile(r'^(\w+)\s*\((.*)\)$', re.DOTALL)
+
+# Sentinel for single-probe dict lookups where None is a valid value
+_MISSING = object()
+
+# Upper bound on entries in each per-interpreter expression cache
+_EXPR_CACHE_SIZE = 4096
+
+# Most released call envs kept for reuse, see KSPLInterpreter._acquire_env
+_ENV_POOL_SIZE = 64
+
+
+def _cache_put(cache: Dict, key: str, value: Any) -> None:
+    """Insert into a bounded cache, forgetting the oldest entry when full."""
+    if len(cache) >= _EXPR_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _const(value: Any) -> Callable[[Dict], Any]:
+    """Return an expression evaluator that always yields *value*."""
+    return lambda env: value
+
+
+def _fail(message: str) -> Callable[[Dict], Any]:
+    """Return an expression evaluator that always raises KSPLRuntimeError."""
+    def evaluator(env: Dict) -> Any:
+        raise KSPLRuntimeError(message)
+    return evaluator
+
+
+_KEYWORD_LITERALS = {'true': True, 'false': False, 'null': None}
+
+
+def _quick_literal(expr: str) -> tuple:
+    """
+    Recognise a string / number / true / false / null literal using only
+    prefix and ``isdecimal()`` checks.  Returns ``(True, value)`` for a
+    literal and ``(False, None)`` for anything else.  *expr* must already
+    be stripped.
+    """
+    head = expr[:1]
+    # String literals (with escape sequences)
+    if head in ('"', "'") and expr[-1:] == head:
+        return True, expr[1:-1].encode('raw_unicode_escape').decode('unicode_escape')
+
+    # KSPL booleans / null
+    value = _KEYWORD_LITERALS.get(expr, _MISSING)
+    if value is not _MISSING:
+        return True, value
+
+    # Integer / float literals (isdecimal() accepts exactly what \d does)
+    digits = expr[1:] if head == '-' else expr
+    if digits.isdecimal():
+        return True, int(expr)
+    whole, dot, frac = digits.partition('.')
+    if dot and whole.isdecimal() and frac.isdecimal():
+        return True, float(expr)
+    return False, None
+
+
+# ---------------------------------------------------------------------------
+# Numeric kernels (numba, optional)
+# ---------------------------------------------------------------------------
+
+_NUMERIC_NODES = (
+    _ast.Expression, _ast.BinOp, _ast.UnaryOp, _ast.Name, _ast.Load,
+    _ast.Constant, _ast.Add, _ast.Sub, _ast.Mult, _ast.Div, _ast.Mod,
+    _ast.UAdd, _ast.USub,
+)
+
+
+def _numeric_names(tree: _ast.AST) -> Optional[List[str]]:
+    """
+    Return the free names of *tree* if it is pure arithmetic on names and
+    numeric constants (``+ - * / %`` and unary signs), otherwise None.
+    """
+    names: List[str] = []
+    for node in _ast.walk(tree):
+        if not isinstance(node, _NUMERIC_NODES):
+            return None
+        if isinstance(node, _ast.Constant) and type(node.value) not in (int, float):
+            return None
+        if isinstance(node, _ast.Name) and node.id not in names:
+            names.append(node.id)
+    return names
+
+
+def _numeric_method_source(params: List[str], lines: List[str]) -> Optional[str]:
+    """
+    Translate a method body made only of ``let`` / assignment / ``return``
+    lines over numeric expressions into the source of ``_kernel(*params)``.
+    Returns None if any line falls outside that subset.
+    """
+    known = set(params)
+    out: List[str] = []
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith('//'):
+            continue
+        if out and out[-1].startswith('return '):
+            return None          # unreachable code after return
+        if line.startswith('return '):
+            target, expr = None, line[7:].strip()
+        else:
+            m = _LET_RE.match(line) or _ASSIGN_RE.match(line)
+            if not m or not _NAME_RE.fullmatch(m.group(1)):
+                return None
+            target, expr = m.group(1), m.group(2).strip()
+            # Plain assignment to an unknown name writes a KSPL global
+            if not line.startswith('let ') and target not in known:
+                return None
+        try:
+            names = _numeric_names(_ast_parse(expr, mode='eval'))
+        except SyntaxError:
+            return None
+        if names is None or not known.issuperset(names):
+            return None
+        if target is None:
+            out.append(f"return ({expr})")
+        else:
+            known.add(target)
+            out.append(f"{target} = {expr}")
+    if not out or not out[-1].startswith('return '):
+        return None
+    return (f"def _kernel({', '.join(params)}):\n" +
+            ''.join(f"    {stmt}\n" for stmt in out))
+
+
+# ---------------------------------------------------------------------------
+# Statement opcodes
+# ---------------------------------------------------------------------------
+
+# parse() emits tuples whose first element is one of these opcodes
+(OP_NOP, OP_EXPR, OP_LET, OP_ASSIGN, OP_RETURN, OP_BREAK, OP_CONTINUE,
+ OP_IF, OP_FOR, OP_WHILE, OP_CLASS, OP_FN) = range(12)
+
+_OPCODES = range(OP_FN + 1)
+
+# Statements run() registers before executing the rest of the program
+_DEFINITION_OPS = (OP_CLASS, OP_FN)
+
+# The globals dict doubles as eval()'s globals, so this name holds the
+# (empty, read-only) builtins and KSPL code may not rebind it
+_EVAL_BUILTINS = '__builtins__'
+
+# Statements whose second element is the name they bind
+_BINDING_OPS = (OP_LET, OP_ASSIGN, OP_FOR, OP_CLASS, OP_FN)
+
+
+def _guard_binding(stmt: tuple) -> tuple:
+    """
+    Return *stmt*, or a statement that raises KSPLRuntimeError when run if
+    *stmt* would rebind the eval builtins name.
+    """
+    if stmt[0] in _BINDING_OPS and stmt[1] == _EVAL_BUILTINS:
+        return (OP_EXPR, _fail(f"Cannot assign to reserved name '{_EVAL_BUILTINS}'"))
+    return stmt
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -53,20 +254,37 @@ class _ContinueSignal(Exception):
 class KSPLClass:
     """Represents a KSPL class definition."""
 
+    __slots__ = ('name', 'methods', 'fields', '_field_template', '_mutable_fields')
+
     def __init__(self, name: str, methods: Dict, fields: Dict):
         self.name = name
-        self.methods = methods    # {method_name: {'params': [...], 'body': [...]}}
+        # {method_name: {'params': [...], 'body': [...], 'env': {...},
+        #                'source': [raw lines]}} or a native kernel, see
+        # KSPLInterpreter.aot_compile_method
+        self.methods = methods
         self.fields = fields      # {field_name: initial_value}
+        # Instances start from this template; list/dict/set defaults are
+        # shallow-copied per instance so objects don't share them.
+        self._field_template = dict(fields)
+        self._mutable_fields = [k for k, v in fields.items()
+                                if isinstance(v, (list, dict, set))]
 
 
 class KSPLObject:
     """Represents an instance of a KSPL class."""
 
+    # KSPL code may set arbitrary fields (self.x = ...), so instances keep a
+    # __dict__ for those; the class link lives in a fixed slot.
+    __slots__ = ('_klass', '__dict__')
+
     def __init__(self, klass: KSPLClass, interpreter: 'KSPLInterpreter',
                  args: List = None):
         self._klass = klass
         # Copy class-level fields
-        self.__dict__.update(klass.fields)
+        if klass._field_template:
+            self.__dict__.update(klass._field_template)
+            for key in klass._mutable_fields:
+                self.__dict__[key] = copy.copy(klass._field_template[key])
 
         # Call constructor (init) if present
         if 'init' in klass.methods:
@@ -82,14 +300,24 @@ class KSPLObject:
                 f"Method '{method_name}' not found in class '{self._klass.name}'"
             )
         method = self._klass.methods[method_name]
-        local_env: Dict = {'self': self}
-        for i, param in enumerate(method['params']):
-            local_env[param] = args[i] if i < len(args) else None
+        if type(method) is not dict:
+            # Natively compiled kernel; takes the arguments without self
+            return method(*args)
+        # Fill a pooled env from the pre-built {'self': None, param: None,
+        # ...} template so missing arguments default to None without a
+        # per-call loop.
+        local_env = interpreter._acquire_env()
+        local_env.update(method['env'])
+        local_env['self'] = self
+        for param, value in zip(method['params'], args):
+            local_env[param] = value
 
         try:
-            return interpreter.execute_block(method['body'], local_env)
+            return interpreter._run_block(method['body'], local_env)
         except _ReturnSignal as ret:
             return ret.value
+        finally:
+            interpreter._release_env(local_env)
 
     def __repr__(self) -> str:
         name = getattr(self, 'name', None)
@@ -101,6 +329,52 @@ class KSPLObject:
         return repr(self)
 
 
+# ---------------------------------------------------------------------------
+# Property access
+# ---------------------------------------------------------------------------
+
+# Attribute names win over keys on dicts (d.keys is the method), so the
+# dict getter checks this set instead of probing with hasattr.
+_DICT_ATTRS = frozenset(dir(dict))
+
+
+def _get_dict_property(obj: dict, prop: str) -> Any:
+    if prop in _DICT_ATTRS:
+        return getattr(obj, prop)
+    return obj.get(prop, _MISSING)
+
+
+def _get_kspl_property(obj: KSPLObject, prop: str) -> Any:
+    value = obj.__dict__.get(prop, _MISSING)
+    if value is _MISSING:
+        value = getattr(obj, prop, _MISSING)
+    return value
+
+
+# Exact-type fast paths; anything else goes through getattr / setattr
+_PROPERTY_GETTERS: Dict[type, Callable[[Any, str], Any]] = {
+    dict: _get_dict_property,
+    KSPLObject: _get_kspl_property,
+}
+_PROPERTY_SETTERS: Dict[type, Callable[[Any, str, Any], None]] = {
+    dict: dict.__setitem__,
+}
+
+
+def _get_property(obj: Any, prop: str) -> Any:
+    """Return ``obj.prop`` (or ``obj[prop]`` for dicts) or raise."""
+    getter = _PROPERTY_GETTERS.get(type(obj))
+    if getter is not None:
+        value = getter(obj, prop)
+    else:
+        value = getattr(obj, prop, _MISSING)
+        if value is _MISSING and isinstance(obj, dict):
+            value = obj.get(prop, _MISSING)
+    if value is _MISSING:
+        raise KSPLRuntimeError(f"Property '{prop}' not found on {obj!r}")
+    return value
+
+
 # ---------------------------------------------------------------------------
 # KSPLInterpreter
 # ---------------------------------------------------------------------------
@@ -119,6 +393,28 @@ class KSPLInterpreter:
         self.classes: Dict[str, KSPLClass] = {}
         self.globals: Dict[str, Any] = {}
         self.vr_environment = vr_environment
+        # Statement handlers indexed by OP_* opcode
+        handlers = {
+            OP_NOP: self._exec_nop,
+            OP_EXPR: self._exec_expr,
+            OP_LET: self._exec_let,
+            OP_ASSIGN: self._exec_assign,
+            OP_RETURN: self._exec_return,
+            OP_BREAK: self._exec_break,
+            OP_CONTINUE: self._exec_continue,
+            OP_IF: self._exec_if,
+            OP_FOR: self._exec_for,
+            OP_WHILE: self._exec_while,
+            OP_CLASS: self._exec_class,
+            OP_FN: self._exec_fn,
+        }
+        self._handlers = tuple(handlers[op] for op in range(len(handlers)))
+        # expression text -> evaluator closure, see _compile_expression
+        self._expr_cache: Dict[str, Callable[[Dict], Any]] = {}
+        # expression text -> compiled code object, see _safe_eval
+        self._code_cache: Dict[str, types.CodeType] = {}
+        # Cleared call envs ready for reuse, see _acquire_env
+        self._env_pool: List[Dict] = []
         self._setup_builtins()
 
     # ------------------------------------------------------------------
@@ -151,6 +447,9 @@ class KSPLInterpreter:
             'round': round,
             'type': type,
 
+            # No Python builtins inside safe-eval'd expressions
+            _EVAL_BUILTINS: types.MappingProxyType({}),
+
             # KSPL literals
             'true': True,
             'false': False,
@@ -188,15 +487,15 @@ class KSPLInterpreter:
 
     def parse(self, source: str) -> List[Any]:
         """
-        Parse KSPL source into a flat list of statement tuples / dicts.
+        Parse KSPL source into a flat list of OP_* statement tuples.
         Multi-line blocks (class, fn, if, for, else) are gathered here.
         Multi-line expressions (e.g. let x = [\n...\n]) are joined first.
         """
         lines = source.split('\n')
-        # Strip line-end comments but preserve strings
-        cleaned = []
-        for ln in lines:
-            cleaned.append(self._strip_line_comment(ln))
+        # Strip line-end comments but preserve strings; only lines that
+        # contain '//' at all need the character scan.
+        cleaned = [self._strip_line_comment(ln) if '//' in ln else ln
+                   for ln in lines]
 
         statements: List = []
         i = 0
@@ -207,37 +506,49 @@ class KSPLInterpreter:
                 continue
 
             # class Foo {
-            if re.match(r'^class\s+\w+\s*\{', line):
-                stmt, i = self._parse_block_stmt(cleaned, i, 'class')
-                statements.append(stmt)
+            if _CLASS_HEAD_RE.match(line):
+                stmt, i = self._parse_guarded(self._parse_block_stmt, cleaned, i, 'class')
 
             # fn foo(...) {
-            elif re.match(r'^fn\s+\w+\s*\(', line):
-                stmt, i = self._parse_block_stmt(cleaned, i, 'fn')
-                statements.append(stmt)
+            elif _FN_HEAD_RE.match(line):
+                stmt, i = self._parse_guarded(self._parse_block_stmt, cleaned, i, 'fn')
 
             # if (...) {  or  if ... {
-            elif re.match(r'^if\s*[\(\s]', line):
-                stmt, i = self._parse_if(cleaned, i)
-                statements.append(stmt)
+            elif _IF_HEAD_RE.match(line):
+                stmt, i = self._parse_guarded(self._parse_if, cleaned, i)
 
             # for x in expr {
-            elif re.match(r'^for\s+\w+\s+in\s+', line):
-                stmt, i = self._parse_for(cleaned, i)
-                statements.append(stmt)
+            elif _FOR_HEAD_RE.match(line):
+                stmt, i = self._parse_guarded(self._parse_for, cleaned, i)
 
             # while (cond) {  or  while cond {
-            elif re.match(r'^while\s*[\(\s]', line):
-                stmt, i = self._parse_while(cleaned, i)
-                statements.append(stmt)
+            elif _WHILE_HEAD_RE.match(line):
+                stmt, i = self._parse_guarded(self._parse_while, cleaned, i)
 
             else:
                 # Handle multi-line expressions: let x = [\n...\n] etc.
                 joined, i = self._join_multiline_stmt(cleaned, i)
-                statements.append(('stmt', joined))
+                stmt = self._lower_stmt(joined)
+
+            statements.append(_guard_binding(stmt))
 
         return statements
 
+    @staticmethod
+    def _parse_guarded(parse_block: Callable, lines: List[str], start: int,
+                       *args) -> tuple:
+        """
+        Run a block parser.  Nested bodies are parsed up front, so a
+        malformed header (e.g. ``for x in xs`` without ``{``) becomes a
+        statement that raises KSPLRuntimeError only if it is executed,
+        and parsing resumes on the next line.
+        """
+        try:
+            return parse_block(lines, start, *args)
+        except Exception as exc:  # pylint: disable=broad-except
+            message = f"Malformed block: {lines[start].strip()!r}  ({exc})"
+            return (OP_EXPR, _fail(message)), start + 1
+
     @staticmethod
     def _bracket_balance(text: str) -> int:
         """Return net bracket/paren/brace depth for a text (ignoring strings)."""
@@ -346,8 +657,16 @@ class KSPLInterpreter:
         while i < len(lines):
             stripped = lines[i].strip()
 
+            # Lines without braces cannot change depth: take them whole
+            # instead of walking them character by character.
+            if '{' not in stripped and '}' not in stripped:
+                if in_inline:
+                    inline_buf.append(stripped)
+                j = len(stripped)
+            else:
+                j = 0
+
             # Walk character-by-character so we can detect depth==0 mid-line
-            j = 0
             while j < len(stripped):
                 ch = stripped[j]
                 if ch == '{':
@@ -368,7 +687,7 @@ class KSPLInterpreter:
                             inline_content = ''.join(inline_buf).strip()
                             if inline_content:
                                 # Multiple statements separated by spaces/newlines
-                                for stmt_part in re.split(r'\s{2,}|\n', inline_content):
+                                for stmt_part in _INLINE_SPLIT_RE.split(inline_content):
                                     stmt_part = stmt_part.strip()
                                     if stmt_part:
                                         body.append(stmt_part)
@@ -408,20 +727,21 @@ class KSPLInterpreter:
         body, next_i, _ = self._collect_block(lines, start)
 
         if kind == 'class':
-            m = re.match(r'^class\s+(\w+)', line)
+            m = _CLASS_RE.match(line)
             class_name = m.group(1)
-            return ('class', class_name, body), next_i
+            return (OP_CLASS, class_name, body), next_i
 
         # kind == 'fn'
-        m = re.match(r'^fn\s+(\w+)\s*\(([^)]*)\)', line)
+        m = _FN_RE.match(line)
         fn_name = m.group(1)
         params = [p.strip() for p in m.group(2).split(',') if p.strip()]
-        return ('function', fn_name, params, body), next_i
+        return (OP_FN, fn_name, params, self._parse_body(body)), next_i
 
     def _parse_if(self, lines: List[str], start: int) -> tuple:
         """
         Parse if / else-if / else chain.
-        Returns a nested dict structure and the next index.
+        Returns (OP_IF, condition, then, [(cond, body), ...], else) and the
+        next index.
 
         Handles all patterns:
           if (cond) { ... }  else { ... }
@@ -443,9 +763,9 @@ class KSPLInterpreter:
         def _check_else(text: str) -> str:
             """Return 'else', 'elseif', or '' depending on text."""
             t = text.strip()
-            if re.match(r'^else\s+if\s*[\(\s]', t):
+            if _ELSEIF_HEAD_RE.match(t):
                 return 'elseif'
-            if re.match(r'^else\s*\{', t):
+            if _ELSE_HEAD_RE.match(t):
                 return 'else'
             return ''
 
@@ -490,30 +810,30 @@ class KSPLInterpreter:
                 else_body = ei_body
                 break
 
-        stmt = {
-            'type': 'if',
-            'condition': condition,
-            'then': then_body,
-            'elseifs': else_ifs,
-            'else': else_body,
-        }
+        stmt = (
+            OP_IF,
+            condition,
+            self._parse_body(then_body),
+            [(c, self._parse_body(b)) for c, b in else_ifs],
+            self._parse_body(else_body),
+        )
         return stmt, next_i
 
     def _parse_for(self, lines: List[str], start: int) -> tuple:
         """Parse for variable in iterable { body }."""
         line = lines[start].strip()
-        m = re.match(r'^for\s+(\w+)\s+in\s+(.*?)\s*\{', line)
+        m = _FOR_RE.match(line)
         var_name = m.group(1)
         iter_expr = m.group(2).strip()
         body, next_i, _ = self._collect_block(lines, start)
-        return ('for', var_name, iter_expr, body), next_i
+        return (OP_FOR, var_name, iter_expr, self._parse_body(body)), next_i
 
     def _parse_while(self, lines: List[str], start: int) -> tuple:
         """Parse while (condition) { body }."""
         line = lines[start].strip()
         cond = self._extract_if_condition(line.replace('while', 'if', 1))
         body, next_i, _ = self._collect_block(lines, start)
-        return ('while', cond, body), next_i
+        return (OP_WHILE, cond, self._parse_body(body)), next_i
 
     # ------------------------------------------------------------------
     # Class loading
@@ -530,19 +850,33 @@ class KSPLInterpreter:
                 i += 1
                 continue
 
-            if re.match(r'^fn\s+\w+\s*\(', line):
-                fn_m = re.match(r'^fn\s+(\w+)\s*\(([^)]*)\)', line)
+            if _FN_HEAD_RE.match(line):
+                fn_m = _FN_RE.match(line)
                 method_name = fn_m.group(1)
                 params = [p.strip() for p in fn_m.group(2).split(',') if p.strip()]
                 # Collect method body
                 method_body, i, _ = self._collect_block(body, i)
-                methods[method_name] = {'params': params, 'body': method_body}
+                methods[method_name] = {
+                    'params': params,
+                    'body': self._parse_body(method_body),
+                    'env': dict.fromkeys(['self'] + params),
+                    # Raw lines, kept for aot_compile_method
+                    'source': method_body,
+                }
 
             elif line.startswith('field '):
-                field_m = re.match(r'^field\s+(\w+)\s*=\s*(.*)', line)
+                field_m = _FIELD_RE.match(line)
                 if field_m:
                     fname = field_m.group(1)
-                    fval = self._eval_expression(field_m.group(2).strip(), {})
+                    fexpr = field_m.group(2).strip()
+                    # Literal defaults skip the expression cache entirely;
+                    # bad escapes are left for the evaluator to report
+                    try:
+                        is_literal, fval = _quick_literal(fexpr)
+                    except ValueError:
+                        is_literal = False
+                    if not is_literal:
+                        fval = self._eval_expression(fexpr, {})
                     fields[fname] = fval
                 i += 1
             else:
@@ -550,6 +884,74 @@ class KSPLInterpreter:
 
         return KSPLClass(class_name, methods, fields)
 
+    def aot_compile_method(self, class_name: str, method_name: str,
+                           signature: Any = None) -> Callable:
+        """
+        Compile a pure-numeric method with numba and install the native
+        kernel in place of its interpreted body.
+
+        The method may only use ``let`` / assignment / ``return`` lines
+        over its parameters, locals and numeric constants (``+ - * / %``),
+        and must not touch ``self``.  *signature* is any signature numba
+        accepts; it defaults to float64 for every parameter and the result,
+        so int arguments and results become floats.  Calls must pass every
+        parameter (missing ones are not filled with null), and division by
+        zero or arguments the signature can't take raise KSPLRuntimeError
+        as in the interpreted method.
+        Requires numba (``pip install kursarscript[jit]``).
+
+        Returns the callable now used by ``call_method``.
+        """
+        if _numba is None:
+            raise KSPLRuntimeError(
+                "aot_compile_method requires numba (pip install kursarscript[jit])"
+            )
+        klass = self.classes.get(class_name)
+        if klass is None:
+            raise KSPLRuntimeError(f"Class '{class_name}' not found")
+        method = klass.methods.get(method_name)
+        if method is None:
+            raise KSPLRuntimeError(
+                f"Method '{method_name}' not found in class '{class_name}'"
+            )
+        if type(method) is not dict:
+            return method        # already compiled
+
+        params = method['params']
+        source = _numeric_method_source(params, method['source'])
+        if source is None:
+            raise KSPLRuntimeError(
+                f"Method '{class_name}.{method_name}' is not pure-numeric"
+            )
+        if signature is None:
+            signature = f"float64({', '.join(['float64'] * len(params))})"
+
+        namespace: Dict = {}
+        exec(compile(source, '<kspl-aot>', 'exec'), namespace)
+        qualname = f"{class_name}.{method_name}"
+        try:
+            # An explicit signature makes njit compile eagerly, so typing
+            # errors surface here.  Unlike a cfunc, the dispatcher passes
+            # exceptions such as ZeroDivisionError back to the caller.
+            compiled = _numba.njit(signature)(namespace['_kernel'])
+        except Exception as exc:
+            raise KSPLRuntimeError(f"Cannot compile '{qualname}': {exc}") from exc
+
+        arity = len(params)
+
+        def kernel(*args):
+            if len(args) != arity:
+                raise KSPLRuntimeError(
+                    f"'{qualname}' takes {arity} arguments ({len(args)} given)"
+                )
+            try:
+                return compiled(*args)
+            except Exception as exc:
+                raise KSPLRuntimeError(f"Error in '{qualname}': {exc}") from exc
+
+        klass.methods[method_name] = kernel
+        return kernel
+
     # ------------------------------------------------------------------
     # Expression evaluation helpers
     # ------------------------------------------------------------------
@@ -599,9 +1001,9 @@ class KSPLInterpreter:
         'else if (cond) {' → 'cond'
         """
         # Strip leading '} ' if present
-        text = re.sub(r'^\}\s*', '', line.strip())
+        text = _CLOSE_BRACE_PREFIX_RE.sub('', line.strip())
         # Strip 'else if'
-        text = re.sub(r'^else\s+if\s*', '', text).strip()
+        text = _ELSEIF_PREFIX_RE.sub('', text).strip()
         # Reuse _extract_if_condition logic but treat text as 'if text'
         rest = text
         depth = 0
@@ -669,81 +1071,127 @@ class KSPLInterpreter:
     # ------------------------------------------------------------------
 
     def _eval_expression(self, expr: str, local_env: Dict) -> Any:
-        expr = expr.strip()
-        if not expr:
-            return None
+        return self._expression(expr)(local_env)
 
-        # String literals
-        if ((expr.startswith('"') and expr.endswith('"')) or
-                (expr.startswith("'") and expr.endswith("'"))):
-            # Support escape sequences
-            return expr[1:-1].encode('raw_unicode_escape').decode('unicode_escape')
+    def _expression(self, expr: str) -> Callable[[Dict], Any]:
+        """Return the (cached) evaluator closure for *expr*."""
+        evaluator = self._expr_cache.get(expr)
+        if evaluator is None:
+            evaluator = self._compile_expression(expr)
+            _cache_put(self._expr_cache, expr, evaluator)
+        return evaluator
 
-        # KSPL booleans / null
-        if expr == 'true':
-            return True
-        if expr == 'false':
-            return False
-        if expr == 'null':
-            return None
+    def _compile_expression(self, expr: str) -> Callable[[Dict], Any]:
+        """
+        Classify *expr* once and return a closure ``f(local_env)`` that
+        evaluates it.  Literals resolve to constants up front; everything
+        else keeps its evaluation path but skips the classification ladder.
+
+        Bodies are compiled at parse time, so an expression that cannot be
+        compiled (e.g. a bad string escape) yields a closure that raises
+        KSPLRuntimeError only if it is actually evaluated.
+        """
+        try:
+            return self._classify_expression(expr)
+        except Exception as exc:  # pylint: disable=broad-except
+            return _fail(f"Cannot evaluate expression: {expr.strip()!r}  ({exc})")
+
+    def _classify_expression(self, expr: str) -> Callable[[Dict], Any]:
+        """The classification ladder behind _compile_expression."""
+        expr = expr.strip()
+        if not expr:
+            return _const(None)
 
-        # Integer / float literals
-        if re.fullmatch(r'-?\d+', expr):
-            return int(expr)
-        if re.fullmatch(r'-?\d+\.\d+', expr):
-            return float(expr)
+        # String / number / boolean / null literals
+        is_literal, value = _quick_literal(expr)
+        if is_literal:
+            return _const(value)
 
         # Inline list literals: [...]
         if expr.startswith('['):
-            return self._eval_list_literal(expr, local_env)
+            return lambda env: self._eval_list_literal(expr, env)
 
         # Inline dict literals: {...}
         if expr.startswith('{'):
-            return self._eval_dict_literal(expr, local_env)
+            return lambda env: self._eval_dict_literal(expr, env)
 
         # Function / method call - only if the ENTIRE expression is a single call.
         # e.g. "len(x)" or "obj.method(a, b)" - NOT "len(x) + len(y)"
-        if re.match(r'^[\w\.]+\s*\(', expr) and self._is_pure_call(expr):
-            return self._eval_call(expr, local_env)
+        if _CALL_HEAD_RE.match(expr) and self._is_pure_call(expr):
+            return self._compile_call(expr)
 
         # Property / index access: obj.prop or obj["key"] or obj[idx]
         # Only treat as pure access chain if it contains no binary operators.
         # Expressions like `data["trend"] == "rising"` should go to _safe_eval.
-        _HAS_OP = re.compile(r'\s*(==|!=|<=|>=|<|>|\+|-|\*|/|%|\band\b|\bor\b|\bnot\b)\s*')
-        if ('.' in expr or '[' in expr) and not _HAS_OP.search(expr):
-            return self._eval_access(expr, local_env)
+        if ('.' in expr or '[' in expr) and not _HAS_OP_RE.search(expr):
+            parts = self._split_access(expr)
+            if _DOTTED_RE.fullmatch(expr):
+                return self._compile_dotted(expr, parts)
+            return lambda env: self._eval_access(expr, env, parts)
 
         # Simple name lookup
-        if re.fullmatch(r'\w+', expr):
-            if expr in local_env:
-                return local_env[expr]
-            if expr in self.globals:
-                return self.globals[expr]
+        if _NAME_RE.fullmatch(expr):
+            return self._compile_name(expr)
+
+        # Arithmetic / comparison: delegate to Python's safe-eval
+        return lambda env: self._safe_eval(expr, env)
+
+    def _compile_dotted(self, expr: str,
+                        parts: List[str]) -> Callable[[Dict], Any]:
+        """
+        Return a closure for a plain ``a.b.c`` chain.  The attribute walk is
+        done by operator.attrgetter in C; dict keys and missing properties
+        fall back to the general _eval_access walker.
+        """
+        resolve_root = self._compile_name(parts[0])
+        getter = operator.attrgetter(expr.split('.', 1)[1])
+
+        def _dotted(env: Dict) -> Any:
+            try:
+                return getter(resolve_root(env))
+            except AttributeError:
+                return self._eval_access(expr, env, parts)
+        return _dotted
+
+    def _compile_name(self, name: str) -> Callable[[Dict], Any]:
+        """Return a closure resolving *name* as local → global → class."""
+        def _lookup(env: Dict) -> Any:
+            value = env.get(name, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = self.globals.get(name, _MISSING)
+            if value is not _MISSING:
+                return value
             # Maybe it's a class constructor name
-            if expr in self.classes:
+            if name in self.classes:
                 interp = self
-                cls_name = expr
                 def _ctor(*args):
-                    return KSPLObject(interp.classes[cls_name], interp, list(args))
+                    return KSPLObject(interp.classes[name], interp, list(args))
                 return _ctor
-
-        # Arithmetic / comparison: delegate to Python's safe-eval
-        return self._safe_eval(expr, local_env)
+            return self._safe_eval(name, env)
+        return _lookup
 
     def _safe_eval(self, expr: str, local_env: Dict) -> Any:
         """Evaluate arbitrary Python-compatible expression safely."""
-        # Build combined environment
-        env: Dict = {}
-        env.update(self.globals)
-        env.update(local_env)
-
-        # Replace KSPL operators with Python equivalents
-        py_expr = expr.replace(' and ', ' and ').replace(' or ', ' or ')
-
         try:
-            tree = _ast.parse(py_expr, mode='eval')
-            return eval(compile(tree, '<expr>', 'eval'),
-                        {'__builtins__': {}}, env)
+            code = self._code_cache.get(expr)
+            if code is None:
+                # Replace KSPL operators with Python equivalents
+                py_expr = expr.replace(' and ', ' and ').replace(' or ', ' or ')
+                tree = _ast_parse(py_expr, mode='eval')
+                # At top level the locals are the globals dict, so ':='
+                # could otherwise rebind eval's builtins
+                for node in _ast.walk(tree):
+                    if isinstance(node, _ast.NamedExpr) and node.target.id == _EVAL_BUILTINS:
+                        raise KSPLRuntimeError(
+                            f"Cannot assign to reserved name '{_EVAL_BUILTINS}'"
+                        )
+                code = compile(tree, '<expr>', 'eval')
+                _cache_put(self._code_cache, expr, code)
+            # The globals dict doubles as eval()'s globals (it carries an
+            # empty, read-only __builtins__ KSPL code cannot rebind), so
+            # nothing is merged per evaluation; locals still shadow globals.
+            return eval(code, self.globals, local_env)
         except Exception as exc:
             raise KSPLRuntimeError(
                 f"Cannot evaluate expression: {expr!r}  ({exc})"
@@ -800,27 +1248,24 @@ class KSPLInterpreter:
 
     # ---- access (obj.prop / obj["key"] / obj[idx]) -------------------------
 
-    def _eval_access(self, expr: str, local_env: Dict) -> Any:
+    def _eval_access(self, expr: str, local_env: Dict,
+                     parts: Optional[List[str]] = None) -> Any:
         """Evaluate property / index access chains."""
         # Decompose into parts, respecting nesting
-        parts = self._split_access(expr)
+        if parts is None:
+            parts = self._split_access(expr)
         obj = self._eval_expression(parts[0], local_env)
 
         for part in parts[1:]:
             # Index access: ["key"] or [idx]
-            idx_m = re.fullmatch(r'\[(.+)\]', part)
+            idx_m = _INDEX_RE.fullmatch(part)
             if idx_m:
                 key = self._eval_expression(idx_m.group(1), local_env)
-                if isinstance(obj, dict):
-                    obj = obj[key]
-                elif isinstance(obj, (list, tuple)):
-                    obj = obj[key]
-                else:
-                    obj = obj[key]
+                obj = obj[key]
                 continue
 
             # Method call: method(args)
-            call_m = re.match(r'^(\w+)\s*\((.*)\)$', part, re.DOTALL)
+            call_m = _METHOD_CALL_RE.match(part)
             if call_m:
                 method_name = call_m.group(1)
                 args_text = call_m.group(2).strip()
@@ -839,22 +1284,7 @@ class KSPLInterpreter:
                 continue
 
             # Property access: .prop
-            prop = part.lstrip('.')
-            if isinstance(obj, KSPLObject):
-                if hasattr(obj, prop):
-                    obj = getattr(obj, prop)
-                else:
-                    raise KSPLRuntimeError(
-                        f"Property '{prop}' not found on {obj!r}"
-                    )
-            elif hasattr(obj, prop):
-                obj = getattr(obj, prop)
-            elif isinstance(obj, dict) and prop in obj:
-                obj = obj[prop]
-            else:
-                raise KSPLRuntimeError(
-                    f"Property '{prop}' not found on {obj!r}"
-                )
+            obj = _get_property(obj, part.lstrip('.'))
 
         return obj
 
@@ -939,44 +1369,54 @@ class KSPLInterpreter:
 
     # ---- function / method call --------------------------------------------
 
-    def _eval_call(self, expr: str, local_env: Dict) -> Any:
-        """Evaluate a function or method call expression."""
+    def _compile_call(self, expr: str) -> Callable[[Dict], Any]:
+        """
+        Return a closure for a function or method call expression.  The
+        callee text and argument list are parsed once; the target itself
+        is still resolved on every call since globals can be rebound.
+        """
         # Find the outermost call
         paren_idx = expr.index('(')
         fn_expr = expr[:paren_idx].strip()
         args_text = expr[paren_idx + 1:-1].strip()
 
-        args = ([self._eval_expression(a.strip(), local_env)
-                 for a in self._split_args(args_text)]
-                if args_text else [])
+        arg_fns = ([self._expression(a.strip())
+                    for a in self._split_args(args_text)]
+                   if args_text else [])
 
         # Method call: obj.method(...)
         if '.' in fn_expr:
             parts = self._split_access(fn_expr)
-            obj = self._eval_expression(parts[0], local_env)
-            for part in parts[1:]:
-                method_name = part
-                if isinstance(obj, KSPLObject):
-                    if method_name in obj._klass.methods:
-                        return obj.call_method(method_name, self, args)
-                    elif hasattr(obj, method_name):
-                        return getattr(obj, method_name)(*args)
-                    else:
-                        raise KSPLRuntimeError(
-                            f"Method '{method_name}' not found on {obj!r}"
-                        )
-                elif hasattr(obj, method_name):
-                    attr = getattr(obj, method_name)
-                    if callable(attr):
-                        return attr(*args)
-                    obj = attr
-                    continue
-                else:
-                    raise KSPLRuntimeError(
-                        f"Method '{method_name}' not found on {obj!r}"
-                    )
-            return obj   # shouldn't reach here normally
+            resolve_obj = self._expression(parts[0])
+            path = parts[1:]
+
+            def _method_call(env: Dict) -> Any:
+                args = [f(env) for f in arg_fns]
+                return self._call_path(resolve_obj(env), path, args)
+            return _method_call
+
+        def _fn_call(env: Dict) -> Any:
+            return self._call_global(fn_expr, [f(env) for f in arg_fns])
+        return _fn_call
+
+    def _call_path(self, obj: Any, path: List[str], args: List) -> Any:
+        """Walk *path* from *obj* and call the method it names."""
+        for method_name in path:
+            is_kspl = isinstance(obj, KSPLObject)
+            if is_kspl and method_name in obj._klass.methods:
+                return obj.call_method(method_name, self, args)
+            attr = getattr(obj, method_name, _MISSING)
+            if attr is _MISSING:
+                raise KSPLRuntimeError(
+                    f"Method '{method_name}' not found on {obj!r}"
+                )
+            if is_kspl or callable(attr):
+                return attr(*args)
+            obj = attr
+        return obj   # shouldn't reach here normally
 
+    def _call_global(self, fn_expr: str, args: List) -> Any:
+        """Call a built-in, user-defined function or class constructor."""
         # Built-in / global function
         if fn_expr in self.globals and callable(self.globals[fn_expr]):
             return self.globals[fn_expr](*args)
@@ -998,35 +1438,31 @@ class KSPLInterpreter:
     @staticmethod
     def _split_args(text: str) -> List[str]:
         """Split comma-separated arguments, respecting nesting and strings."""
+        # Track the start of the current argument and slice it out at each
+        # top-level comma instead of accumulating it character by character.
         args: List[str] = []
-        current: List[str] = []
+        start = 0
         depth = 0
         in_str = False
         str_ch = None
 
-        for ch in text:
+        for i, ch in enumerate(text):
             if in_str:
-                current.append(ch)
                 if ch == str_ch:
                     in_str = False
             elif ch in ('"', "'"):
                 in_str = True
                 str_ch = ch
-                current.append(ch)
             elif ch in ('(', '[', '{'):
                 depth += 1
-                current.append(ch)
             elif ch in (')', ']', '}'):
                 depth -= 1
-                current.append(ch)
             elif ch == ',' and depth == 0:
-                args.append(''.join(current))
-                current = []
-            else:
-                current.append(ch)
+                args.append(text[start:i])
+                start = i + 1
 
-        if current:
-            args.append(''.join(current))
+        if start < len(text):
+            args.append(text[start:])
 
         return args
 
@@ -1036,143 +1472,204 @@ class KSPLInterpreter:
 
     def execute_statement(self, stmt: Any, local_env: Dict) -> Any:
         """Execute a single parsed statement."""
+        stmt = self._as_statement(stmt)
+        return self._handlers[stmt[0]](stmt, local_env)
 
-        # Dict: if / for block
-        if isinstance(stmt, dict):
-            return self._exec_control(stmt, local_env)
+    def _as_statement(self, stmt: Any) -> tuple:
+        """
+        Return *stmt* as an OP_* tuple.  Besides parsed statements this
+        accepts raw single-line strings and the name-tagged tuples and
+        ``{'type': 'if', ...}`` dicts older versions of parse() produced.
+        """
+        # Parsed statements are tuples tagged with an OP_* opcode
+        if isinstance(stmt, tuple) and stmt and stmt[0] in _OPCODES:
+            return stmt
+
+        # ('stmt', raw), ('class', name, lines), ('function', name, params,
+        # body), ('for', var, iterable, body) and ('while', cond, body)
+        if isinstance(stmt, tuple) and stmt:
+            try:
+                kind = stmt[0]
+                if kind == 'stmt':
+                    _, raw = stmt
+                    return _guard_binding(self._lower_stmt(raw))
+                if kind == 'class':
+                    _, name, lines = stmt
+                    return _guard_binding((OP_CLASS, name, lines))
+                if kind == 'function':
+                    _, name, params, body = stmt
+                    return _guard_binding(
+                        (OP_FN, name, params, self._parse_body(body)))
+                if kind == 'for':
+                    _, var, iterable, body = stmt
+                    return _guard_binding(
+                        (OP_FOR, var, iterable, self._parse_body(body)))
+                if kind == 'while':
+                    _, cond, body = stmt
+                    return (OP_WHILE, cond, self._parse_body(body))
+            except ValueError:
+                pass
 
-        # Tuple: class / fn definition or ('stmt', raw_line)
-        if isinstance(stmt, tuple):
-            kind = stmt[0]
+        # Plain string (shouldn't normally happen but handle gracefully)
+        if isinstance(stmt, str):
+            return _guard_binding(self._lower_stmt(stmt))
+
+        if isinstance(stmt, dict) and stmt.get('type') == 'if':
+            return (
+                OP_IF,
+                stmt['condition'],
+                self._parse_body(stmt.get('then') or []),
+                [(c, self._parse_body(b)) for c, b in stmt.get('elseifs', [])],
+                self._parse_body(stmt.get('else') or []),
+            )
 
-            if kind == 'class':
-                _, class_name, body = stmt
-                klass = self._load_class(class_name, body)
-                self.classes[class_name] = klass
-                interp = self
-                def _make_ctor(cn):
-                    def _ctor(*args):
-                        return KSPLObject(interp.classes[cn], interp, list(args))
-                    return _ctor
-                self.globals[class_name] = _make_ctor(class_name)
-                return None
+        raise KSPLRuntimeError(f"Cannot execute statement: {stmt!r}")
 
-            if kind == 'function':
-                _, fn_name, params, body = stmt
-                interp = self
-                # Capture params and body in closure
-                def _make_fn(p, b):
-                    def _fn(*args):
-                        env = dict(zip(p, args))
-                        try:
-                            return interp.execute_block(b, env)
-                        except _ReturnSignal as ret:
-                            return ret.value
-                    return _fn
-                self.globals[fn_name] = _make_fn(params, body)
-                return None
+    # ---- opcode handlers: (stmt, local_env) -> result -----------------
 
-            if kind == 'for':
-                _, var_name, iter_expr, body = stmt
-                iterable = self._eval_expression(iter_expr, local_env)
-                result = None
-                for item in iterable:
-                    local_env[var_name] = item
-                    try:
-                        result = self.execute_block(body, local_env)
-                    except _BreakSignal:
-                        break
-                    except _ContinueSignal:
-                        continue
-                    except _ReturnSignal:
-                        raise
-                return result
-
-            if kind == 'while':
-                _, cond_expr, body = stmt
-                result = None
-                import sys as _sys
-                _guard = 0
-                _MAX = 100_000
-                while self._eval_expression(cond_expr, local_env):
-                    _guard += 1
-                    if _guard > _MAX:
-                        raise KSPLRuntimeError(
-                            f"Infinite loop detected (exceeded {_MAX} iterations)"
-                        )
-                    try:
-                        result = self.execute_block(body, local_env)
-                    except _BreakSignal:
-                        break
-                    except _ContinueSignal:
-                        continue
-                    except _ReturnSignal:
-                        raise
-                return result
+    def _exec_nop(self, stmt: tuple, local_env: Dict) -> Any:
+        return None
 
-            if kind == 'stmt':
-                return self._exec_raw_stmt(stmt[1], local_env)
+    def _exec_expr(self, stmt: tuple, local_env: Dict) -> Any:
+        return stmt[1](local_env)
+
+    def _exec_let(self, stmt: tuple, local_env: Dict) -> Any:
+        val = stmt[2](local_env)
+        local_env[stmt[1]] = val
+        return val
+
+    def _exec_assign(self, stmt: tuple, local_env: Dict) -> Any:
+        val = stmt[2](local_env)
+        self._assign(stmt[1], val, local_env)
+        return val
+
+    def _exec_return(self, stmt: tuple, local_env: Dict) -> Any:
+        raise _ReturnSignal(stmt[1](local_env))
+
+    def _exec_break(self, stmt: tuple, local_env: Dict) -> Any:
+        raise _BreakSignal()
+
+    def _exec_continue(self, stmt: tuple, local_env: Dict) -> Any:
+        raise _ContinueSignal()
+
+    def _exec_if(self, stmt: tuple, local_env: Dict) -> Any:
+        _, condition, then_body, elseifs, else_body = stmt
+        if self._eval_expression(condition, local_env):
+            return self._run_block(then_body, local_env)
+        for ei_cond, ei_body in elseifs:
+            if self._eval_expression(ei_cond, local_env):
+                return self._run_block(ei_body, local_env)
+        if else_body:
+            return self._run_block(else_body, local_env)
+        return None
 
-        # Plain string (shouldn't normally happen but handle gracefully)
-        if isinstance(stmt, str):
-            return self._exec_raw_stmt(stmt, local_env)
+    def _exec_for(self, stmt: tuple, local_env: Dict) -> Any:
+        _, var_name, iter_expr, body = stmt
+        iterable = self._eval_expression(iter_expr, local_env)
+        result = None
+        for item in iterable:
+            local_env[var_name] = item
+            try:
+                result = self._run_block(body, local_env)
+            except _BreakSignal:
+                break
+            except _ContinueSignal:
+                continue
+        return result
 
+    def _exec_while(self, stmt: tuple, local_env: Dict) -> Any:
+        _, cond_expr, body = stmt
+        result = None
+        _guard = 0
+        _MAX = 100_000
+        while self._eval_expression(cond_expr, local_env):
+            _guard += 1
+            if _guard > _MAX:
+                raise KSPLRuntimeError(
+                    f"Infinite loop detected (exceeded {_MAX} iterations)"
+                )
+            try:
+                result = self._run_block(body, local_env)
+            except _BreakSignal:
+                break
+            except _ContinueSignal:
+                continue
+        return result
+
+    def _exec_class(self, stmt: tuple, local_env: Dict) -> Any:
+        _, class_name, body = stmt
+        klass = self._load_class(class_name, body)
+        self.classes[class_name] = klass
+        interp = self
+        def _make_ctor(cn):
+            def _ctor(*args):
+                return KSPLObject(interp.classes[cn], interp, list(args))
+            return _ctor
+        self.globals[class_name] = _make_ctor(class_name)
         return None
 
-    def _exec_control(self, stmt: dict, local_env: Dict) -> Any:
-        """Execute if/else control flow dict."""
-        if stmt['type'] == 'if':
-            cond = self._eval_expression(stmt['condition'], local_env)
-            if cond:
-                return self.execute_block(stmt['then'], local_env)
-            for ei_cond, ei_body in stmt.get('elseifs', []):
-                if self._eval_expression(ei_cond, local_env):
-                    return self.execute_block(ei_body, local_env)
-            if stmt.get('else'):
-                return self.execute_block(stmt['else'], local_env)
+    def _exec_fn(self, stmt: tuple, local_env: Dict) -> Any:
+        _, fn_name, params, body = stmt
+        interp = self
+        # Capture params and the body, parsed once, in a closure
+        def _make_fn(p, b):
+            def _fn(*args):
+                env = interp._acquire_env()
+                env.update(zip(p, args))
+                try:
+                    return interp._run_block(b, env)
+                except _ReturnSignal as ret:
+                    return ret.value
+                finally:
+                    interp._release_env(env)
+            return _fn
+        self.globals[fn_name] = _make_fn(tuple(params), self._parse_body(body))
         return None
 
-    def _exec_raw_stmt(self, raw: str, local_env: Dict) -> Any:
-        """Execute a raw single-line KSPL statement."""
+    def _lower_stmt(self, raw: str) -> tuple:
+        """
+        Classify a raw single-line KSPL statement once, returning an
+        opcode tuple whose expressions are already resolved to evaluator
+        closures:
+
+          (OP_NOP,)  (OP_BREAK,)  (OP_CONTINUE,)  (OP_RETURN, value_fn)
+          (OP_LET, name, value_fn)  (OP_ASSIGN, target, value_fn)
+          (OP_EXPR, value_fn)
+        """
         stmt = raw.strip()
         if not stmt or stmt.startswith('//'):
-            return None
+            return (OP_NOP,)
 
         # return expr
         if stmt.startswith('return '):
-            val = self._eval_expression(stmt[7:].strip(), local_env)
-            raise _ReturnSignal(val)
+            return (OP_RETURN, self._expression(stmt[7:].strip()))
 
         # return (bare)
         if stmt == 'return':
-            raise _ReturnSignal(None)
+            return (OP_RETURN, _const(None))
 
         # break
         if stmt == 'break':
-            raise _BreakSignal()
+            return (OP_BREAK,)
 
         # continue
         if stmt == 'continue':
-            raise _ContinueSignal()
+            return (OP_CONTINUE,)
 
         # let name = expr
-        let_m = re.match(r'^let\s+(\w+)\s*=\s*(.+)$', stmt, re.DOTALL)
+        let_m = _LET_RE.match(stmt)
         if let_m:
-            name = let_m.group(1)
-            val = self._eval_expression(let_m.group(2).strip(), local_env)
-            local_env[name] = val
-            return val
+            return (OP_LET, let_m.group(1),
+                    self._expression(let_m.group(2).strip()))
 
         # obj.prop = expr  or  name = expr  (assignment, not equality test)
-        assign_m = re.match(r'^([\w\.]+(?:\[.*?\])?)\s*=\s*(.+)$', stmt, re.DOTALL)
+        assign_m = _ASSIGN_RE.match(stmt)
         if assign_m and '==' not in stmt and '!=' not in stmt and '>=' not in stmt and '<=' not in stmt:
-            target = assign_m.group(1).strip()
-            val = self._eval_expression(assign_m.group(2).strip(), local_env)
-            self._assign(target, val, local_env)
-            return val
+            return (OP_ASSIGN, assign_m.group(1).strip(),
+                    self._expression(assign_m.group(2).strip()))
 
         # Everything else: expression / call
-        return self._eval_expression(stmt, local_env)
+        return (OP_EXPR, self._expression(stmt))
 
     def _assign(self, target: str, value: Any, local_env: Dict) -> None:
         """Assign value to a (possibly dotted) target."""
@@ -1198,40 +1695,76 @@ class KSPLInterpreter:
             obj = None
 
         for part in parts[1:-1]:
-            idx_m = re.fullmatch(r'\[(.+)\]', part)
+            idx_m = _INDEX_RE.fullmatch(part)
             if idx_m:
                 key = self._eval_expression(idx_m.group(1), local_env)
                 obj = obj[key]
             else:
-                obj = getattr(obj, part)
+                obj = _get_property(obj, part)
 
         last = parts[-1]
-        idx_m = re.fullmatch(r'\[(.+)\]', last)
+        idx_m = _INDEX_RE.fullmatch(last)
         if idx_m:
             key = self._eval_expression(idx_m.group(1), local_env)
             obj[key] = value
         else:
-            setattr(obj, last, value)
+            _PROPERTY_SETTERS.get(type(obj), setattr)(obj, last, value)
 
     # ------------------------------------------------------------------
     # Block execution
     # ------------------------------------------------------------------
 
+    def _acquire_env(self) -> Dict:
+        """Return an empty local env, reusing a released one if available."""
+        pool = self._env_pool
+        return pool.pop() if pool else {}
+
+    def _release_env(self, env: Dict) -> None:
+        """
+        Clear *env* and keep it for the next call.  Nothing retains a call
+        env once the call returns: evaluators take the env as an argument
+        and nested fn/class definitions do not close over it.
+        """
+        env.clear()
+        if len(self._env_pool) < _ENV_POOL_SIZE:
+            self._env_pool.append(env)
+
+    def _parse_body(self, statements: List) -> List:
+        """
+        If the block is a list of raw strings (e.g. method bodies stored
+        as lines), join them and re-parse as a whole so that multi-line
+        constructs (if/else, for, nested classes) are handled correctly.
+        Already-parsed blocks are returned unchanged; any other entries in
+        a mixed list are converted one by one.
+        """
+        if not statements:
+            return statements
+        if all(isinstance(s, str) for s in statements):
+            return self.parse('\n'.join(statements))
+        if all(type(s) is tuple and s and s[0] in _OPCODES for s in statements):
+            return statements
+        return [self._as_statement(s) for s in statements]
+
     def execute_block(self, statements: List, local_env: Dict = None) -> Any:
         """Execute a list of statements / raw strings in a shared env."""
         if local_env is None:
-            local_env = {}
+            local_env = self._acquire_env()
+            try:
+                return self.execute_block(statements, local_env)
+            finally:
+                self._release_env(local_env)
 
-        # If the block is a list of raw strings (e.g. method bodies stored
-        # as lines), join them and re-parse as a whole so that multi-line
-        # constructs (if/else, for, nested classes) are handled correctly.
-        if statements and all(isinstance(s, str) for s in statements):
-            source = '\n'.join(statements)
-            statements = self.parse(source)
+        return self._run_block(self._parse_body(statements), local_env)
 
+    def _run_block(self, statements: List[tuple], local_env: Dict) -> Any:
+        """
+        Execute already-parsed statements.  Bodies built by parse() and
+        _load_class come straight here, skipping execute_block's checks.
+        """
+        handlers = self._handlers
         result = None
         for stmt in statements:
-            result = self.execute_statement(stmt, local_env)
+            result = handlers[stmt[0]](stmt, local_env)
         return result
 
     # ------------------------------------------------------------------
@@ -1242,13 +1775,10 @@ class KSPLInterpreter:
         """Parse and execute KSPL source code."""
         statements = self.parse(source)
 
-        # Pass 1: register classes and functions
-        for stmt in statements:
-            if isinstance(stmt, tuple) and stmt[0] in ('class', 'function'):
-                self.execute_statement(stmt, self.globals)
-
-        # Pass 2: execute remaining statements
-        for stmt in statements:
-            if isinstance(stmt, tuple) and stmt[0] in ('class', 'function'):
-                continue
-            self.execute_statement(stmt, self.globals)
+        # Register classes and functions first, then run everything else;
+        # source order is kept within each group.
+        ordered = ([st for st in statements if st[0] in _DEFINITION_OPS] +
+                   [st for st in statements if st[0] not in _DEFINITION_OPS])
+        handlers = self._handlers
+        for stmt in ordered:
+            handlers[stmt[0]](stmt, self.globals)
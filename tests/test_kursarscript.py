@@ -360,6 +360,192 @@ let result = add(3, 4)
         interp = run(src)
         assert interp.globals["result"] == 7
 
+    def test_functions_keep_their_own_bodies(self):
+        interp = run("""
+fn one() {
+    return 1
+}
+fn two() {
+    return 2
+}
+let a = one()
+let b = two()
+""")
+        assert (interp.globals["a"], interp.globals["b"]) == (1, 2)
+
+    def test_function_body_parsed_once(self, monkeypatch):
+        interp = KSPLInterpreter()
+        interp.run("""
+fn double(x) {
+    return x * 2
+}
+""")
+        calls = []
+        original = interp.parse
+        monkeypatch.setattr(interp, "parse", lambda src: calls.append(src) or original(src))
+        assert interp.globals["double"](4) == 8
+        assert interp.globals["double"](5) == 10
+        assert calls == []
+
+    def test_call_envs_are_pooled(self):
+        interp = run("""
+fn fact(n) {
+    if n <= 1 {
+        return 1
+    }
+    return n * fact(n - 1)
+}
+let a = fact(5)
+let b = fact(6)
+""")
+        assert (interp.globals["a"], interp.globals["b"]) == (120, 720)
+        # Released envs are cleared before reuse
+        assert interp._env_pool and all(env == {} for env in interp._env_pool)
+
+    def test_env_pool_is_bounded(self):
+        from kursarscript import interpreter as mod
+        interp = KSPLInterpreter()
+        envs = [interp._acquire_env() for _ in range(mod._ENV_POOL_SIZE + 10)]
+        for env in envs:
+            env["x"] = 1
+            interp._release_env(env)
+        assert len(interp._env_pool) == mod._ENV_POOL_SIZE
+        assert all(env == {} for env in envs)
+
+
+class TestStatementLowering:
+    """Bodies are parsed and lowered once, not on every execution."""
+
+    def test_lowered_statement_tags(self):
+        from kursarscript import interpreter as mod
+        interp = KSPLInterpreter()
+        ops = [s[0] for s in interp.parse(
+            "let a = 1\na = 2\nprint(a)\nbreak\ncontinue\nreturn a\n"
+            "if a {\n}\nfor x in a {\n}\nwhile a {\n}\nfn f() {\n}\nclass C {\n}"
+        )]
+        assert ops == [
+            mod.OP_LET, mod.OP_ASSIGN, mod.OP_EXPR, mod.OP_BREAK,
+            mod.OP_CONTINUE, mod.OP_RETURN, mod.OP_IF, mod.OP_FOR,
+            mod.OP_WHILE, mod.OP_FN, mod.OP_CLASS,
+        ]
+
+    def test_definitions_registered_before_statements(self):
+        interp = run("""
+let r = later(2)
+fn later(x) {
+    return x + 1
+}
+""")
+        assert interp.globals["r"] == 3
+
+    def test_no_parse_during_method_and_loop_execution(self, monkeypatch):
+        interp = KSPLInterpreter()
+        interp.run("""
+class Counter {
+    field n = 0
+    fn bump(k) {
+        for i in range(k) {
+            self.n = self.n + 1
+        }
+        return self.n
+    }
+}
+let c = Counter()
+""")
+        calls = []
+        original = interp.parse
+        monkeypatch.setattr(interp, "parse", lambda src: calls.append(src) or original(src))
+        c = interp.globals["c"]
+        assert c.call_method("bump", interp, [3]) == 3
+        assert c.call_method("bump", interp, [2]) == 5
+        assert calls == []
+
+    def test_execute_block_accepts_mixed_lists(self):
+        interp = KSPLInterpreter()
+        env = {}
+        interp.execute_block(interp.parse("let a = 1") + ["let b = a + 1"], env)
+        assert env == {"a": 1, "b": 2}
+
+    def test_execute_block_rejects_unknown_tuples(self):
+        interp = KSPLInterpreter()
+        with pytest.raises(KSPLRuntimeError):
+            interp.execute_block([(99, "let a = 1")], {})
+
+    def test_execute_statement_runs_legacy_if_dict(self):
+        interp = KSPLInterpreter()
+        env = {"x": 0}
+        stmt = {"type": "if", "condition": "x > 0", "then": ["let r = 1"],
+                "elseifs": [], "else": ["let r = 2"]}
+        interp.execute_statement(stmt, env)
+        assert env["r"] == 2
+
+    def test_execute_statement_runs_legacy_tuples(self):
+        interp = KSPLInterpreter()
+        env = {}
+        interp.execute_statement(("stmt", "let a = 1"), env)
+        interp.execute_statement(("function", "inc", ["x"], ["return x + 1"]), env)
+        interp.execute_statement(("for", "i", "range(3)", ["a = a + inc(i)"]), env)
+        interp.execute_statement(("while", "a < 10", ["a = a * 2"]), env)
+        interp.execute_statement(("class", "Box", ["field n = 1"]), env)
+        assert env["a"] == 14
+        assert interp.classes["Box"].fields == {"n": 1}
+        interp.execute_block([("stmt", "let b = a")], env)
+        assert env["b"] == 14
+
+    def test_execute_statement_rejects_unknown_shapes(self):
+        interp = KSPLInterpreter()
+        with pytest.raises(KSPLRuntimeError):
+            interp.execute_statement(42, {})
+        with pytest.raises(KSPLRuntimeError):
+            interp.execute_statement(("stmt",), {})
+        with pytest.raises(KSPLRuntimeError):
+            interp.execute_statement(("goto", "label"), {})
+
+    def test_bad_expression_in_untaken_branch_is_lazy(self, capsys):
+        interp = run("""
+if false {
+    let s = "bad \\x"
+}
+class C {
+    fn never() {
+        return "bad \\x"
+    }
+}
+print("ok")
+let c = C()
+""")
+        assert "ok" in capsys.readouterr().out
+        with pytest.raises(KSPLRuntimeError):
+            interp.globals["c"].call_method("never", interp, [])
+
+    @pytest.mark.parametrize("block", [
+        "for i in range(3)\n    print(i)",
+        "fn f(a {\n    }",
+    ])
+    def test_bad_block_header_in_untaken_branch_is_lazy(self, capsys, block):
+        run(f"""
+if false {{
+    {block}
+}}
+print("ok")
+""")
+        assert "ok" in capsys.readouterr().out
+
+    def test_bad_block_header_in_uncalled_method_is_lazy(self, capsys):
+        interp = run("""
+class C {
+    fn never() {
+        for i in range(3)
+        print(i)
+    }
+}
+print("ok")
+let c = C()
+""")
+        assert "ok" in capsys.readouterr().out
+        with pytest.raises(KSPLRuntimeError, match="Malformed block"):
+            interp.globals["c"].call_method("never", interp, [])
+
 
 class TestInterpreterClasses:
     def test_class_instantiation(self):
@@ -533,6 +719,29 @@ class TestCompiler:
         assert len(let_tokens) == 1
         assert let_tokens[0]["value"] == "x"
 
+    def test_tokenize_keyword_forms(self):
+        compiler = KSPLCompiler()
+        tokens = compiler.tokenize(
+            "field hp = 10\nreturn hp\nif hp > 0 {\n} else {\n}"
+        )
+        assert [t["type"] for t in tokens] == [
+            "FIELD_DEF", "RETURN", "IF_STMT", "ELSE_STMT", "BRACE_CLOSE",
+        ]
+        assert tokens[0]["expr"] == "10"
+        assert tokens[2]["condition"] == "hp > 0"
+
+    def test_tokenize_line_numbers_skip_blanks_and_comments(self):
+        compiler = KSPLCompiler()
+        tokens = compiler.tokenize("// header\n\nlet a = 1\n  // note\nlet b = 2")
+        assert [(t["value"], t["line"]) for t in tokens] == [("a", 3), ("b", 5)]
+
+    def test_tokenize_keyword_prefixed_names(self):
+        compiler = KSPLCompiler()
+        tokens = compiler.tokenize("classy = 1\nlettuce = 2\nfnord(3)")
+        assert [t["type"] for t in tokens] == [
+            "ASSIGNMENT", "ASSIGNMENT", "EXPRESSION",
+        ]
+
     def test_compile_produces_structure(self):
         compiler = KSPLCompiler()
         source = """
@@ -885,6 +1094,70 @@ let fruits = [
         with pytest.raises((KSPLRuntimeError, Exception)):
             run("let x = totally_undefined_xyz_func()")
 
+    def test_mutable_field_default_not_shared(self):
+        interp = run("""
+class Bag {
+    field items = []
+}
+let a = Bag()
+let b = Bag()
+""")
+        interp.globals["a"].items.append(1)
+        assert interp.globals["a"].items == [1]
+        assert interp.globals["b"].items == []
+
+    def test_object_dict_holds_only_fields(self):
+        interp = run("""
+class Box {
+    field size = 1
+}
+let b = Box()
+b.color = "red"
+""")
+        assert interp.globals["b"].__dict__ == {"size": 1, "color": "red"}
+
+    def test_method_missing_args_default_to_null(self):
+        interp = run("""
+class Pair {
+    fn init(a, b) {
+        self.a = a
+        self.b = b
+    }
+}
+let p = Pair(1)
+let q = Pair(2, 3, 4)
+""")
+        p, q = interp.globals["p"], interp.globals["q"]
+        assert (p.a, p.b) == (1, None)
+        assert (q.a, q.b) == (2, 3)
+
+    def test_split_args_nesting_and_strings(self):
+        parts = KSPLInterpreter._split_args('a, f(b, c), [1, 2], "x, y", {k: v}')
+        assert [p.strip() for p in parts] == [
+            'a', 'f(b, c)', '[1, 2]', '"x, y"', '{k: v}',
+        ]
+
+    def test_quick_literal(self):
+        from kursarscript.interpreter import _quick_literal
+        assert _quick_literal('42') == (True, 42)
+        assert _quick_literal('-1.5') == (True, -1.5)
+        assert _quick_literal('"a\\tb"') == (True, 'a\tb')
+        assert _quick_literal('true') == (True, True)
+        assert _quick_literal('null') == (True, None)
+        assert _quick_literal('1e3') == (False, None)
+        assert _quick_literal('x + 1') == (False, None)
+
+    def test_literal_fields_skip_expression_cache(self):
+        interp = run("""
+class Box {
+    field size = 3
+    field label = "box"
+    field items = []
+}
+""")
+        assert interp.classes["Box"].fields == {"size": 3, "label": "box", "items": []}
+        assert list(interp._expr_cache) == ["[]"]
+
 
 # ---------------------------------------------------------------------------
 # New language features: while, break, continue, inline method bodies
@@ -1165,3 +1438,245 @@ class TestAdvancedExample:
         assert "SKIPPING boss" in out
 
 
+# ---------------------------------------------------------------------------
+# Expression evaluator cache
+# ---------------------------------------------------------------------------
+
+class TestExpressionCache:
+    """Cached evaluators must still honour the environment they run in."""
+
+    def test_cached_name_sees_new_env(self):
+        interp = KSPLInterpreter()
+        assert interp._eval_expression("x", {"x": 1}) == 1
+        assert interp._eval_expression("x", {"x": 2}) == 2
+
+    def test_cached_list_literal_is_fresh(self):
+        interp = KSPLInterpreter()
+        first = interp._eval_expression("[1, 2]", {})
+        first.append(3)
+        assert interp._eval_expression("[1, 2]", {}) == [1, 2]
+
+    def test_loop_reuses_cache_entry(self):
+        interp = run("""
+let total = 0
+for i in range(5) {
+    total = total + i
+}
+""")
+        assert interp.globals["total"] == 10
+        assert "total + i" in interp._expr_cache
+
+    def test_numeric_literals(self):
+        interp = KSPLInterpreter()
+        assert interp._eval_expression("-42", {}) == -42
+        assert interp._eval_expression("3.25", {}) == 3.25
+        assert interp._eval_expression("-0.5", {}) == -0.5
+        with pytest.raises(KSPLRuntimeError):
+            interp._eval_expression("1.2.3", {})
+
+    def test_dotted_chain_attributes_and_dict_keys(self):
+        interp = run("""
+let hero = Avatar("Hero", "warrior")
+let cfg = {"inner": {"v": 3}}
+let who = hero.name
+let v = cfg.inner.v
+""")
+        assert interp.globals["who"] == "Hero"
+        assert interp.globals["v"] == 3
+
+    def test_dict_attributes_win_over_keys(self):
+        interp = KSPLInterpreter()
+        d = {"keys": 1, "v": 2}
+        assert interp._eval_expression("d.v", {"d": d}) == 2
+        assert interp._eval_expression("d.keys", {"d": d}) == d.keys
+
+    def test_dotted_assignment_into_dict(self):
+        interp = run("""
+let cfg = {"inner": {"v": 1}}
+cfg.inner.v = 5
+""")
+        assert interp.globals["cfg"] == {"inner": {"v": 5}}
+
+    def test_dotted_chain_missing_property(self):
+        interp = KSPLInterpreter()
+        with pytest.raises(KSPLRuntimeError):
+            interp._eval_expression("a.nope", {"a": Avatar("A", "user")})
+
+    def test_cached_call_resolves_target_each_time(self):
+        interp = KSPLInterpreter()
+        interp.globals["f"] = lambda x: x + 1
+        assert interp._eval_expression("f(n)", {"n": 1}) == 2
+        interp.globals["f"] = lambda x: x * 10
+        assert interp._eval_expression("f(n)", {"n": 2}) == 20
+
+    def test_safe_eval_compiles_once(self):
+        interp = KSPLInterpreter()
+        assert interp._safe_eval("a * 2", {"a": 3}) == 6
+        code = interp._code_cache["a * 2"]
+        assert interp._safe_eval("a * 2", {"a": 5}) == 10
+        assert interp._code_cache["a * 2"] is code
+
+    def test_safe_eval_sees_current_globals(self):
+        interp = KSPLInterpreter()
+        interp.globals["g"] = 2
+        assert interp._safe_eval("g + a", {"a": 1}) == 3
+        interp.globals["g"] = 10
+        assert interp._safe_eval("g + a", {"a": 1}) == 11
+        # Locals still shadow globals, and no Python builtins leak in
+        assert interp._safe_eval("g", {"g": 7}) == 7
+        with pytest.raises(KSPLRuntimeError):
+            interp._safe_eval("open", {})
+
+    @pytest.mark.parametrize("src", [
+        '__builtins__ = {"open": 1}',
+        'let __builtins__ = null',
+        'for __builtins__ in [1] {\n}',
+        'fn __builtins__() {\n}',
+        'class __builtins__ {\n}',
+        'let a = (__builtins__ := {"open": 1})',
+    ])
+    def test_eval_builtins_cannot_be_rebound(self, src):
+        interp = KSPLInterpreter()
+        with pytest.raises(KSPLRuntimeError, match="reserved name"):
+            interp.run(src)
+        with pytest.raises(KSPLRuntimeError, match="not defined"):
+            interp._safe_eval("open", {})
+
+    def test_eval_builtins_are_read_only(self):
+        interp = KSPLInterpreter()
+        with pytest.raises(Exception):
+            interp.run('__builtins__["open"] = 1')
+        with pytest.raises(KSPLRuntimeError, match="not defined"):
+            interp._safe_eval("open", {})
+
+    def test_cache_is_bounded(self):
+        from kursarscript import interpreter as mod
+        interp = KSPLInterpreter()
+        for n in range(mod._EXPR_CACHE_SIZE + 10):
+            interp._eval_expression(str(n), {})
+        assert len(interp._expr_cache) == mod._EXPR_CACHE_SIZE
+
+
+# ---------------------------------------------------------------------------
+# Native numeric methods (numba, optional)
+# ---------------------------------------------------------------------------
+
+AOT_SRC = """
+class Physics {
+    fn step(pos, vel, dt) {
+        let moved = pos + vel * dt
+        moved = moved % 100.0
+        return moved
+    }
+    fn ratio(a, b) {
+        return a / b
+    }
+    fn describe() {
+        return "physics"
+    }
+}
+let p = Physics()
+"""
+
+
+@pytest.fixture
+def fake_numba(monkeypatch):
+    """Install a pass-through numba so the plumbing runs without it."""
+    from kursarscript import interpreter as mod
+
+    class FakeNumba:
+        signatures = []
+
+        @classmethod
+        def njit(cls, sig):
+            cls.signatures.append(sig)
+            return lambda fn: fn
+
+    monkeypatch.setattr(mod, "_numba", FakeNumba)
+    return FakeNumba
+
+
+class TestNumericNames:
+    """Pure-arithmetic detection used by aot_compile_method."""
+
+    def test_numeric_names(self):
+        import ast
+        from kursarscript.interpreter import _numeric_names
+        assert sorted(_numeric_names(ast.parse("(a + b) * 2 - -c", mode="eval"))) == ["a", "b", "c"]
+        assert _numeric_names(ast.parse("a > b", mode="eval")) is None
+        assert _numeric_names(ast.parse("f(a)", mode="eval")) is None
+        assert _numeric_names(ast.parse("a + 'x'", mode="eval")) is None
+
+
+class TestAotCompile:
+    def test_method_replaced_by_kernel(self, fake_numba):
+        interp = run(AOT_SRC)
+        kernel = interp.aot_compile_method("Physics", "step")
+        assert fake_numba.signatures == ["float64(float64, float64, float64)"]
+        assert interp.classes["Physics"].methods["step"] is kernel
+        assert interp._eval_expression("p.step(95.0, 10.0, 1.0)", {"p": interp.globals["p"]}) == 5.0
+        # Compiling again is a no-op
+        assert interp.aot_compile_method("Physics", "step") is kernel
+        assert len(fake_numba.signatures) == 1
+
+    def test_kernel_errors_are_runtime_errors(self, fake_numba):
+        interp = run(AOT_SRC)
+        interp.aot_compile_method("Physics", "ratio")
+        p = interp.globals["p"]
+        with pytest.raises(KSPLRuntimeError, match="takes 2 arguments"):
+            p.call_method("ratio", interp, [1.0])
+        with pytest.raises(KSPLRuntimeError):
+            p.call_method("ratio", interp, [1.0, 0.0])
+
+    def test_rejects_non_numeric_method(self, fake_numba):
+        interp = run(AOT_SRC)
+        with pytest.raises(KSPLRuntimeError, match="not pure-numeric"):
+            interp.aot_compile_method("Physics", "describe")
+        with pytest.raises(KSPLRuntimeError, match="not found"):
+            interp.aot_compile_method("Physics", "missing")
+
+    def test_requires_numba(self, monkeypatch):
+        from kursarscript import interpreter as mod
+        monkeypatch.setattr(mod, "_numba", None)
+        interp = run(AOT_SRC)
+        with pytest.raises(KSPLRuntimeError, match="requires numba"):
+            interp.aot_compile_method("Physics", "step")
+
+    def test_numeric_method_source(self):
+        from kursarscript.interpreter import _numeric_method_source
+        assert _numeric_method_source(["a", "b"], ["let c = a * b", "return c + 1"]) == (
+            "def _kernel(a, b):\n    c = a * b\n    return (c + 1)\n"
+        )
+        assert _numeric_method_source(["a"], ["g = a", "return a"]) is None
+        assert _numeric_method_source(["a"], ["return self.x + a"]) is None
+        assert _numeric_method_source(["a"], ["print(a)", "return a"]) is None
+        assert _numeric_method_source(["a"], ["let b = a"]) is None
+
+
+class TestAotCompileNumba:
+    """The same paths compiled by the real numba, when installed."""
+
+    @pytest.fixture(autouse=True)
+    def _numba(self):
+        pytest.importorskip("numba")
+
+    def test_kernel_matches_interpreted_method(self):
+        interp = run(AOT_SRC)
+        p = interp.globals["p"]
+        expected = p.call_method("step", interp, [95.0, 10.0, 1.0])
+        interp.aot_compile_method("Physics", "step")
+        assert p.call_method("step", interp, [95.0, 10.0, 1.0]) == expected
+        # float64 signature: int arguments come back as floats
+        assert p.call_method("step", interp, [1, 2, 3]) == 7.0
+
+    def test_division_by_zero_raises(self):
+        interp = run(AOT_SRC)
+        interp.aot_compile_method("Physics", "ratio")
+        with pytest.raises(KSPLRuntimeError):
+            interp.globals["p"].call_method("ratio", interp, [1.0, 0.0])
+
+    def test_arity_mismatch_raises(self):
+        interp = run(AOT_SRC)
+        interp.aot_compile_method("Physics", "step")
+        with pytest.raises(KSPLRuntimeError, match="takes 3 arguments"):
+            interp.globals["p"].call_method("step", interp, [1.0, 2.0])